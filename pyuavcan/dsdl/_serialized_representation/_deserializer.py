@@ -208,18 +208,17 @@ class Deserializer(abc.ABC):
                 # It is faster because here we are aware that the destination is always aligned, which we take
                 # advantage of. This algorithm breaks for byte-aligned offset, so we have to delegate the aligned
                 # case to the aligned copy method (which is also much faster).
-                out = numpy.empty(count, dtype=_Byte)
                 right = self._bit_offset % 8
                 left = 8 - right
                 assert (1 <= right <= 7) and (1 <= left <= 7)
                 # The last byte is a special case because if we're reading the last few unaligned bits, the very last
                 # byte access will be always out of range. We don't care because of the implicit zero extension rule.
-                for i in range(count):
-                    byte_offset = self._byte_offset
-                    out[i] = ((self._buf.get_byte(byte_offset) >> right)
-                              | ((self._buf.get_byte(byte_offset + 1) << left) & 0xFF))
-                    self._bit_offset += 8
-                assert len(out) == count
+                # The byte-by-byte loop is vectorized: every output byte is composed of two adjacent source bytes.
+                bo = self._byte_offset
+                src = self._buf.get_unsigned_slice(bo, bo + count + 1)
+                out: numpy.ndarray = (src[:-1] >> right) | ((src[1:] << left) & 0xFF)
+                self._bit_offset += count * 8
+                assert len(out) == count and out.dtype == _Byte
                 return out
             else:
                 return self.fetch_aligned_bytes(count)
@@ -164,12 +164,20 @@ class Serializer(abc.ABC):
         # This is a faster variant of Ben Dyer's unaligned bit copy algorithm:
         # https://github.com/UAVCAN/libuavcan/blob/fd8ba19bc9c09c05a/libuavcan/src/marshal/uc_bit_array_copy.cpp#L12
         # It is faster because here we are aware that the source is always aligned, which we take advantage of.
-        left = self._bit_offset % 8
-        right = 8 - left
-        for b in value:
-            self._buf[self._byte_offset] |= (b << left) & 0xFF
-            self._bit_offset += 8
-            self._buf[self._byte_offset] = b >> right
+        # The byte-by-byte loop is vectorized: every destination byte is composed of the low part of the current
+        # source byte and the high part of the previous one; the last source byte spills over into the next
+        # destination byte.
+        count = len(value)
+        if count > 0:
+            left = self._bit_offset % 8
+            right = 8 - left
+            bo = self._byte_offset
+            lo = (value << left) & 0xFF
+            hi = value >> right
+            self._buf[bo] |= lo[0]
+            self._buf[bo + 1:bo + count] = lo[1:] | hi[:-1]
+            self._buf[bo + count] = hi[-1]
+            self._bit_offset += count * 8
 
     def add_unaligned_unsigned(self, value: int, bit_length: int) -> None:
         self._ensure_not_negative(value)
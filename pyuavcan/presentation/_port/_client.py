@@ -8,6 +8,7 @@ from __future__ import annotations
 import typing
 import asyncio
 import logging
+import functools
 import dataclasses
 import pyuavcan.dsdl
 import pyuavcan.transport
@@ -194,6 +195,12 @@ class ClientImpl(Closable, typing.Generic[ServiceClass]):
         self.input_transport_session = input_transport_session
         self.output_transport_session = output_transport_session
 
+        # The nested types are accessed on every request and response, so they are looked up only once.
+        self._request_type = dtype.Request
+        self._response_type = dtype.Response
+        # The instance is logged often (e.g., on every proxy registration and removal); the model lookup is not free.
+        self._dtype_str = str(pyuavcan.dsdl.get_model(dtype))
+
         self.sent_request_count = 0
         self.unsent_request_count = 0
         self.deserialization_failure_count = 0
@@ -221,36 +228,43 @@ class ClientImpl(Closable, typing.Generic[ServiceClass]):
                    priority:         pyuavcan.transport.Priority,
                    response_timeout: float) \
             -> typing.Optional[typing.Tuple[pyuavcan.dsdl.CompositeObject, pyuavcan.transport.TransferFrom]]:
-        async with self._lock:
-            self._raise_if_closed()
+        self._raise_if_closed()
 
-            # We have to compute the modulus here manually instead of just letting the transport do that because
-            # the response will use the modulus instead of the full TID and we have to match it with the request.
-            transfer_id = self.transfer_id_counter.get_then_increment() % self._transfer_id_modulo_factory()
-            if transfer_id in self._response_futures_by_transfer_id:
-                raise RequestTransferIDVariabilityExhaustedError(repr(self))
+        # We have to compute the modulus here manually instead of just letting the transport do that because
+        # the response will use the modulus instead of the full TID and we have to match it with the request.
+        # No locking is needed here because the transfer-ID allocation and the registration of the future do not
+        # involve context switching.
+        transfer_id = self.transfer_id_counter.get_then_increment() % self._transfer_id_modulo_factory()
+        if transfer_id in self._response_futures_by_transfer_id:
+            raise RequestTransferIDVariabilityExhaustedError(repr(self))
 
-            try:
-                future = self._loop.create_future()
-                self._response_futures_by_transfer_id[transfer_id] = future
-                # The lock is still taken, this is intentional. Serialize access to the transport.
-                send_result = await self._do_send_until(request=request,
-                                                        transfer_id=transfer_id,
-                                                        priority=priority,
-                                                        monotonic_deadline=self._loop.time() + response_timeout)
-            except BaseException:
-                self._forget_future(transfer_id)
-                raise
+        future = self._loop.create_future()
+        self._response_futures_by_transfer_id[transfer_id] = future
 
-        # Wait for the response with the lock released.
         # We have to make sure that no matter what happens, we remove the future from the table upon exit;
         # otherwise the user will get a false exception when the same transfer ID is reused (which only happens
         # with some low-capability transports such as CAN bus though).
         try:
+            # Serialize access to the transport. Some transports (e.g., UDP, serial) emit multi-frame transfers
+            # frame by frame without holding a lock across the whole transfer, so concurrent requests would
+            # interleave their frames, and the receiving side can reassemble only one transfer at a time.
+            async with self._lock:
+                send_result = await self._do_send_until(request=request,
+                                                        transfer_id=transfer_id,
+                                                        priority=priority,
+                                                        monotonic_deadline=self._loop.time() + response_timeout)
             if send_result:
                 self.sent_request_count += 1
-                response, transfer = await asyncio.wait_for(future, timeout=response_timeout, loop=self._loop)
-                assert isinstance(response, self.dtype.Response)
+                # The future is owned by this method, so instead of wrapping it with asyncio.wait_for(), which
+                # involves an additional waiter future and callbacks, we simply fail it when the timeout expires.
+                # Unlike wait_for(), a non-positive timeout lets the loop run one iteration before the call fails;
+                # this does not affect the proxy class because it only accepts positive timeouts.
+                timeout_handle = self._loop.call_later(response_timeout, _fail_on_timeout, future)
+                try:
+                    response, transfer = await future
+                finally:
+                    timeout_handle.cancel()
+                assert isinstance(response, self._response_type)
                 assert isinstance(transfer, pyuavcan.transport.TransferFrom)
                 return response, transfer
             else:
@@ -295,12 +309,14 @@ class ClientImpl(Closable, typing.Generic[ServiceClass]):
                              transfer_id:        int,
                              priority:           pyuavcan.transport.Priority,
                              monotonic_deadline: float) -> bool:
-        if not isinstance(request, self.dtype.Request):
-            raise TypeError(f'Invalid request object: expected an instance of {self.dtype.Request}, '
+        if not isinstance(request, self._request_type):
+            raise TypeError(f'Invalid request object: expected an instance of {self._request_type}, '
                             f'got {type(request)} instead.')
 
         timestamp = pyuavcan.transport.Timestamp.now()
-        fragmented_payload = list(pyuavcan.dsdl.serialize(request))
+        # The payload cannot be passed as a lazy iterable because the transport may traverse it more than once
+        # (e.g., the redundant transport shares the same transfer across all inferiors); see FragmentedPayload.
+        fragmented_payload = tuple(pyuavcan.dsdl.serialize(request))
         transfer = pyuavcan.transport.Transfer(timestamp=timestamp,
                                                priority=priority,
                                                transfer_id=transfer_id,
@@ -309,25 +325,31 @@ class ClientImpl(Closable, typing.Generic[ServiceClass]):
 
     async def _task_function(self) -> None:
         exception: typing.Optional[Exception] = None
+        # The loop below runs for the entire lifetime of the client; pre-bind the entities it uses on every iteration.
+        receive_until = self.input_transport_session.receive_until
+        loop_time = self._loop.time
+        deserialize_response = functools.partial(pyuavcan.dsdl.deserialize, self._response_type)
+        pop_future = self._response_futures_by_transfer_id.pop
         try:
             while not self._closed:
-                transfer = await self.input_transport_session.receive_until(self._loop.time() + _RECEIVE_TIMEOUT)
+                transfer = await receive_until(loop_time() + _RECEIVE_TIMEOUT)
                 if transfer is None:
                     continue
 
-                response = pyuavcan.dsdl.deserialize(self.dtype.Response, transfer.fragmented_payload)
+                response = deserialize_response(transfer.fragmented_payload)
                 if response is None:
                     self.deserialization_failure_count += 1
                     continue
 
-                try:
-                    fut = self._response_futures_by_transfer_id.pop(transfer.transfer_id)
-                except LookupError:
-                    _logger.info('Unexpected response %s with transfer %s; TID values of pending requests: %r',
-                                 response, transfer, list(self._response_futures_by_transfer_id.keys()))
-                    self.unexpected_response_count += 1
-                else:
+                # If the request has timed out but not yet removed its future, the response is unexpected as well.
+                fut = pop_future(transfer.transfer_id, None)
+                if fut is not None and not fut.done():
                     fut.set_result((response, transfer))
+                else:
+                    if _logger.isEnabledFor(logging.INFO):  # pragma: no branch
+                        _logger.info('Unexpected response %s with transfer %s; TID values of pending requests: %r',
+                                     response, transfer, list(self._response_futures_by_transfer_id.keys()))
+                    self.unexpected_response_count += 1
         except asyncio.CancelledError:
             _logger.debug('Cancelling the task of %s', self)
         except Exception as ex:
@@ -337,7 +359,7 @@ class ClientImpl(Closable, typing.Generic[ServiceClass]):
 
         try:
             self._closed = True
-            self._finalizer([self.input_transport_session, self.output_transport_session])
+            self._finalizer((self.input_transport_session, self.output_transport_session))
         except Exception as ex:
             exception = ex
             # Do not use f-string because it can throw, unlike the built-in formatting facility of the logger
@@ -363,7 +385,12 @@ class ClientImpl(Closable, typing.Generic[ServiceClass]):
 
     def __repr__(self) -> str:
         return pyuavcan.util.repr_attributes_noexcept(self,
-                                                      dtype=str(pyuavcan.dsdl.get_model(self.dtype)),
+                                                      dtype=self._dtype_str,
                                                       input_transport_session=self.input_transport_session,
                                                       output_transport_session=self.output_transport_session,
                                                       proxy_count=self._proxy_count)
+
+
+def _fail_on_timeout(future: asyncio.Future[typing.Any]) -> None:
+    if not future.done():
+        future.set_exception(asyncio.TimeoutError())
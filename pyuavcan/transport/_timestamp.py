@@ -55,7 +55,12 @@ class Timestamp:
 
         .. important:: Clocks are sampled non-atomically! Monotonic sampled first.
         """
-        return Timestamp(monotonic_ns=time.monotonic_ns(), system_ns=time.time_ns())
+        # This method is invoked for nearly every transfer and frame, so it bypasses the constructor:
+        # the clock samples are always non-negative integers, there is nothing to convert or validate.
+        out: Timestamp = object.__new__(Timestamp)
+        out._monotonic_ns = time.monotonic_ns()
+        out._system_ns = time.time_ns()
+        return out
 
     @staticmethod
     def combine_oldest(*arguments: Timestamp) -> Timestamp:
@@ -151,4 +156,8 @@ def _unittest_timestamp() -> None:
     assert Timestamp.combine_oldest(Timestamp(123, 123456789000),
                                     Timestamp(5123456789, 456),
                                     ts) == Timestamp(123, 456)
+
+    now = Timestamp.now()
+    assert isinstance(now.system_ns, int) and isinstance(now.monotonic_ns, int)
+    assert Timestamp(now.system_ns, now.monotonic_ns) == now
     print(ts)
@@ -29,6 +29,16 @@ _MAX_ALLOWED_SERIALIZATION_DESERIALIZATION_TIME = 90e-3
 # and be killed, especially so in cloud-hosted CI systems which are always memory-impaired.
 _MAX_RANDOM_SERIALIZED_REPRESENTATION_FRAGMENTS = 1000
 
+# Serialization and deserialization are timed over batches of objects rather than individually to reduce the
+# overhead and the bias introduced by sampling the clock. The batch size is also limited by the total size of the
+# serialized representations, otherwise large data types would take up too much memory.
+_MAX_SERIALIZATION_BATCH_SIZE = 10
+_MAX_SERIALIZATION_BATCH_SIZE_BYTES = 10 * 1024 ** 2
+
+# Random serialized representations are sliced from a pool of random bytes generated in one call rather than
+# generating each one separately. The pool size is limited to avoid excessive memory use with large data types.
+_MAX_RANDOM_BYTE_POOL_SIZE_BYTES = 10 * 1024 ** 2
+
 # Set this environment variable to a higher value for a deeper state exploration.
 _NUM_RANDOM_SAMPLES = int(os.environ.get('PYUAVCAN_TEST_NUM_RANDOM_SAMPLES', 5))
 
@@ -88,38 +98,53 @@ def _unittest_slow_random(generated_packages: typing.List[pyuavcan.dsdl.Generate
 def _test_type(model: pydsdl.CompositeType, num_random_samples: int) -> _TypeTestStatistics:
     _logger.debug('Roundtrip serialization test of %s with %d random samples', model, num_random_samples)
     dtype = pyuavcan.dsdl.get_class(model)
-    samples: typing.List[typing.Tuple[float, float]] = [
-        _serialize_deserialize(dtype())
-    ]
-    rand_sr_validness: typing.List[bool] = []
-
-    def once(obj: pyuavcan.dsdl.CompositeObject) -> typing.Tuple[float, float]:
-        s = _serialize_deserialize(obj)
-        samples.append(s)
-        return s
-
+    # The bit length set is materialized once per type rather than once per random sample.
+    bit_lengths = list(pyuavcan.dsdl.get_model(dtype).bit_length_set)
+    batch_size = max(1, min(_MAX_SERIALIZATION_BATCH_SIZE,
+                            _MAX_SERIALIZATION_BATCH_SIZE_BYTES * 8 // max(max(bit_lengths), 1)))
+    batch: typing.List[pyuavcan.dsdl.CompositeObject] = [dtype()]
+    total_time = numpy.zeros(2, dtype=numpy.float64)    # Serialization, deserialization
+    num_samples = 0
+    rand_sr_validness = numpy.empty(num_random_samples, dtype=bool)
+
+    def flush() -> None:
+        nonlocal num_samples
+        if batch:
+            total_time[:] += _serialize_deserialize_batch(batch)
+            num_samples += len(batch)
+            batch.clear()
+
+    # The forward and reverse tests are run in separate phases rather than interleaved so that each phase keeps
+    # exercising the same code paths back-to-back.
+    # Forward test: get random object, serialize, deserialize, compare
     for index in range(num_random_samples):
         ts = time.process_time()
-        # Forward test: get random object, serialize, deserialize, compare
-        sample_ser = once(_util.make_random_object(model))
+        batch.append(_util.make_random_object(model))
+        elapsed = time.process_time() - ts
+        if elapsed > 1.0:
+            _logger.debug(f'Random object {index + 1} of {num_random_samples} took {elapsed:.1f} s to construct')
+        if len(batch) >= batch_size:
+            flush()
+    flush()
 
-        # Reverse test: get random serialized representation, deserialize; if successful, serialize again and compare
-        sr = _make_random_fragmented_serialized_representation(pyuavcan.dsdl.get_model(dtype).bit_length_set)
+    # Reverse test: get random serialized representation, deserialize; if successful, serialize again and compare
+    srs = _make_random_fragmented_serialized_representations(bit_lengths, num_random_samples)
+    for index in range(num_random_samples):
+        ts = time.process_time()
+        sr = next(srs)
         ob = pyuavcan.dsdl.deserialize(dtype, sr)
-        rand_sr_validness.append(ob is not None)
-        sample_des: typing.Optional[typing.Tuple[float, float]] = None
+        rand_sr_validness[index] = ob is not None
         if ob:
-            sample_des = once(ob)
-
+            batch.append(ob)
         elapsed = time.process_time() - ts
         if elapsed > 1.0:
-            duration_ser = f'{sample_ser[0] * 1e6:.0f}/{sample_ser[1] * 1e6:.0f}'
-            duration_des = f'{sample_des[0] * 1e6:.0f}/{sample_des[1] * 1e6:.0f}' if sample_des else 'N/A'
-            _logger.debug(f'Random sample {index + 1} of {num_random_samples} took {elapsed:.1f} s; '
-                          f'random SR correct: {ob is not None}; '
-                          f'duration forward/reverse [us]: ({duration_ser})/({duration_des})')
+            _logger.debug(f'Random SR {index + 1} of {num_random_samples} took {elapsed:.1f} s to construct; '
+                          f'random SR correct: {ob is not None}')
+        if len(batch) >= batch_size:
+            flush()
+    flush()
 
-    out = numpy.mean(samples, axis=0)
+    out = total_time / num_samples
     assert out.shape == (2,)
     return _TypeTestStatistics(
         mean_serialization_time=out[0],
@@ -128,40 +153,55 @@ def _test_type(model: pydsdl.CompositeType, num_random_samples: int) -> _TypeTes
     )
 
 
-def _serialize_deserialize(obj: pyuavcan.dsdl.CompositeObject) -> typing.Tuple[float, float]:
+def _serialize_deserialize_batch(objects: typing.Sequence[pyuavcan.dsdl.CompositeObject]) \
+        -> typing.Tuple[float, float]:
+    """
+    Returns the total serialization and deserialization time of the batch, in seconds.
+    """
     gc.collect()
     gc.disable()        # Must be disabled, otherwise it induces spurious false-positive performance warnings
 
-    ts = time.process_time()
-    chunks = list(pyuavcan.dsdl.serialize(obj))         # GC must be disabled while we're in the timed context
-    ser_sample = time.process_time() - ts
+    # GC must be disabled while we're in the timed context
+    ts = time.process_time_ns()
+    srs = [list(pyuavcan.dsdl.serialize(obj)) for obj in objects]
+    ser_time = time.process_time_ns() - ts
 
-    ts = time.process_time()
-    d = pyuavcan.dsdl.deserialize(type(obj), chunks)    # GC must be disabled while we're in the timed context
-    des_sample = time.process_time() - ts
+    ts = time.process_time_ns()
+    ds = [pyuavcan.dsdl.deserialize(type(obj), chunks) for obj, chunks in zip(objects, srs)]
+    des_time = time.process_time_ns() - ts
 
     gc.enable()
 
-    assert d is not None
-    assert type(obj) is type(d)
-    assert pyuavcan.dsdl.get_model(obj) == pyuavcan.dsdl.get_model(d)
-
-    if not _util.are_close(pyuavcan.dsdl.get_model(obj), obj, d):  # pragma: no cover
-        assert False, f'{obj} != {d}; sr: {bytes().join(chunks).hex()}'  # Branched for performance reasons
-
-    # Similar floats may produce drastically different string representations, so if there is at least one float inside,
-    # we skip the string representation equality check.
-    if pydsdl.FloatType.__name__ not in repr(pyuavcan.dsdl.get_model(d)):
-        assert str(obj) == str(d)
-        assert repr(obj) == repr(d)
-
-    return ser_sample, des_sample
-
-
-def _make_random_fragmented_serialized_representation(bls: pydsdl.BitLengthSet) -> typing.Sequence[memoryview]:
-    bit_length = random.choice(list(bls))
-    byte_length = (bit_length + 7) // 8
-    return _fragment_randomly(numpy.random.randint(0, 256, size=byte_length, dtype=numpy.uint8).data)
+    for obj, chunks, d in zip(objects, srs, ds):
+        assert d is not None
+        assert type(obj) is type(d)
+        assert pyuavcan.dsdl.get_model(obj) == pyuavcan.dsdl.get_model(d)
+
+        if not _util.are_close(pyuavcan.dsdl.get_model(obj), obj, d):  # pragma: no cover
+            assert False, f'{obj} != {d}; sr: {bytes().join(chunks).hex()}'  # Branched for performance reasons
+
+        # Similar floats may produce drastically different string representations, so if there is at least one float
+        # inside, we skip the string representation equality check.
+        if pydsdl.FloatType.__name__ not in repr(pyuavcan.dsdl.get_model(d)):
+            assert str(obj) == str(d)
+            assert repr(obj) == repr(d)
+
+    return ser_time * 1e-9, des_time * 1e-9
+
+
+def _make_random_fragmented_serialized_representations(bit_lengths: typing.Sequence[int], count: int) \
+        -> typing.Iterator[typing.Sequence[memoryview]]:
+    max_byte_length = (max(bit_lengths) + 7) // 8
+    pool_capacity = max(1, _MAX_RANDOM_BYTE_POOL_SIZE_BYTES // max(max_byte_length, 1))
+    pool = memoryview(b'')
+    for index in range(count):
+        pool_index = index % pool_capacity
+        if pool_index == 0:
+            pool_size = min(pool_capacity, count - index) * max_byte_length
+            pool = numpy.random.randint(0, 256, size=pool_size, dtype=numpy.uint8).data
+        byte_length = (random.choice(bit_lengths) + 7) // 8
+        offset = pool_index * max_byte_length
+        yield _fragment_randomly(pool[offset:offset + byte_length])
 
 
 def _fragment_randomly(data: memoryview) -> typing.List[memoryview]:
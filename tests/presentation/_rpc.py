@@ -6,6 +6,7 @@
 
 import typing
 import asyncio
+import contextlib
 import pytest
 import pyuavcan
 from . import TRANSPORT_FACTORIES, TransportFactory
@@ -120,3 +121,111 @@ async def _unittest_slow_presentation_rpc(generated_packages: typing.List[pyuavc
     assert list(pres_b.transport.input_sessions) == []
     assert list(pres_a.transport.output_sessions) == []
     assert list(pres_b.transport.output_sessions) == []
+
+
+
+# noinspection PyProtectedMember
+@pytest.mark.asyncio  # type: ignore
+async def _unittest_slow_presentation_rpc_concurrent_multi_frame(
+        generated_packages: typing.List[pyuavcan.dsdl.GeneratedPackageInfo]) -> None:
+    """
+    Concurrent multi-frame requests sent via the same client must not interleave their frames on the wire,
+    otherwise the server can reassemble only one of them. The UDP transport does not serialize the frames of
+    a transfer, so the client has to do that.
+    """
+    assert generated_packages
+    from pyuavcan.transport.udp import UDPTransport, UDPOutputSession
+    from sirius_cyber_corp import PerformLinearLeastSquaresFit_1_0, PointXY_1_0
+
+    async with _least_squares_rpc(UDPTransport('127.0.0.123/8'), UDPTransport('127.0.0.42/8')) as client:
+        client.response_timeout = 2.0
+
+        # The smallest MTU accepted by the transport exceeds the size of the request, so it has to be forced down.
+        # This relies on UDPOutputSession reading the MTU from this attribute anew on every send.
+        assert client._maybe_impl is not None
+        request_session = client._maybe_impl.output_transport_session
+        assert isinstance(request_session, UDPOutputSession)
+        request_session._mtu = 32
+
+        results = await asyncio.gather(
+            client.call(PerformLinearLeastSquaresFit_1_0.Request(points=[PointXY_1_0(x=1, y=2)] * 60)),
+            client.call(PerformLinearLeastSquaresFit_1_0.Request(points=[PointXY_1_0(x=3, y=4)] * 50)),
+        )
+        assert [r[0].slope if r is not None else None for r in results] == [60, 50]  # type: ignore
+        assert request_session.sample_statistics().transfers == 2
+        assert request_session.sample_statistics().frames > 2
+
+
+# noinspection PyProtectedMember
+@pytest.mark.parametrize('transport_factory', TRANSPORT_FACTORIES)  # type: ignore
+@pytest.mark.asyncio  # type: ignore
+async def _unittest_slow_presentation_rpc_late_response(
+        generated_packages: typing.List[pyuavcan.dsdl.GeneratedPackageInfo],
+        transport_factory:  TransportFactory) -> None:
+    """
+    A response that arrives after the request has timed out shall be dropped, and the client shall keep working.
+    """
+    assert generated_packages
+    from sirius_cyber_corp import PerformLinearLeastSquaresFit_1_0, PointXY_1_0
+
+    tran_a, tran_b, _ = transport_factory(123, 42)
+    response_delay = 0.0
+
+    async with _least_squares_rpc(tran_a, tran_b, lambda: response_delay) as client:
+        # The response is sent after the request has timed out.
+        response_delay = 1.0
+        client.response_timeout = 0.3
+        assert await client.call(PerformLinearLeastSquaresFit_1_0.Request(points=[PointXY_1_0()] * 2)) is None
+        assert client._maybe_impl is not None
+        assert client._maybe_impl._response_futures_by_transfer_id == {}
+        assert client.sample_statistics().unexpected_responses == 0
+
+        await asyncio.sleep(1.5)  # Wait for the late response to arrive.
+        assert client.sample_statistics().unexpected_responses == 1
+        assert client.sample_statistics().deserialization_failures == 0
+
+        # The response task is still running, so the client is still usable.
+        response_delay = 0.0
+        client.response_timeout = 2.0
+        result = await client.call(PerformLinearLeastSquaresFit_1_0.Request(points=[PointXY_1_0()] * 3))
+        assert result is not None
+        assert result[0].slope == 3  # type: ignore
+        assert client.sample_statistics().sent_requests == 2
+
+
+@contextlib.asynccontextmanager
+async def _least_squares_rpc(server_transport: pyuavcan.transport.Transport,
+                             client_transport: pyuavcan.transport.Transport,
+                             response_delay:   typing.Callable[[], float] = lambda: 0.0) \
+        -> typing.AsyncIterator[pyuavcan.presentation.Client[typing.Any]]:
+    """
+    Serves the test service PerformLinearLeastSquaresFit on the server transport and yields a client for it
+    on the client transport. The response slope equals the number of points in the request.
+    The response is delayed by the value returned by the callable, which is invoked for every request.
+    Everything is closed on exit.
+    """
+    import sirius_cyber_corp
+    from sirius_cyber_corp import PerformLinearLeastSquaresFit_1_0
+
+    assert server_transport.local_node_id is not None
+    pres_server = pyuavcan.presentation.Presentation(server_transport)
+    pres_client = pyuavcan.presentation.Presentation(client_transport)
+    server = pres_server.get_server(PerformLinearLeastSquaresFit_1_0, 222)
+    client = pres_client.make_client(PerformLinearLeastSquaresFit_1_0, 222, server_transport.local_node_id)
+
+    async def server_handler(request: sirius_cyber_corp.PerformLinearLeastSquaresFit_1_0.Request,
+                             metadata: pyuavcan.presentation.ServiceRequestMetadata) \
+            -> typing.Optional[sirius_cyber_corp.PerformLinearLeastSquaresFit_1_0.Response]:
+        print('SERVICE REQUEST:', len(request.points), metadata)
+        await asyncio.sleep(response_delay())
+        return PerformLinearLeastSquaresFit_1_0.Response(slope=len(request.points))
+
+    server.serve_in_background(server_handler)
+    try:
+        yield client
+    finally:
+        server.close()
+        client.close()
+        await asyncio.sleep(0.1)  # Allow the tasks to finish
+        pres_server.close()
+        pres_client.close()